@@ -0,0 +1,106 @@
+"""
+bulk_insert.py
+
+Helper to write a batch of documents to a MongoDB collection with a single unordered bulk_write,
+instead of paying one network round-trip per document with insert_one.
+Batches can also be submitted to a thread pool: PyMongo releases the GIL around socket I/O,
+so several bulk writes can be in flight at once on the client's connection pool.
+"""
+
+from concurrent.futures import as_completed
+import logfire
+from pymongo import InsertOne
+from pymongo.errors import BulkWriteError
+
+# Server error code for a write rejected by a unique index
+DUPLICATE_KEY = 11000
+# Batches allowed to wait in an executor queue before submit_insert makes the reader wait
+MAX_IN_FLIGHT = 32
+
+
+def bulk_insert(collection, docs):
+    """
+    Inserts docs into collection with one unordered bulk_write.
+    Documents that fail (e.g. duplicate keys) are logged one by one, with the server error code, and counted
+    without aborting the rest of the batch. Write concern errors are logged as warnings.
+    The batch span records the _id of its first and last document, so a batch can be traced back to its records.
+    On an unacknowledged (w=0) collection the whole batch is counted as inserted once it has been sent.
+    Returns:
+        tuple: (inserted, failed) document counts.
+    """
+    if not docs:
+        return 0, 0
+
+    # One span per batch carries the timing, counts and id range that used to be logged per document
+    with logfire.span("Inserted batch into {collection}", collection=collection.name, batch_size=len(docs)) as span:
+        try:
+            if not collection.write_concern.acknowledged:
+                # w=0: the server sends no reply, so nothing can be counted (or bypassed) per batch
+                try:
+                    collection.bulk_write([InsertOne(doc) for doc in docs], ordered=False)
+                except Exception as e:
+                    logfire.error("Error inserting batch", collection=collection.name, error=str(e), size=len(docs))
+                    return 0, len(docs)
+                span.set_attribute("acknowledged", False)
+                return len(docs), 0
+
+            try:
+                result = collection.bulk_write(
+                    [InsertOne(doc) for doc in docs],
+                    ordered=False,
+                    bypass_document_validation=True,
+                )
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                for write_error in write_errors:
+                    if write_error.get("code") == DUPLICATE_KEY:
+                        # Rejected by a unique index: expected when re-running an import
+                        logfire.info("Duplicate record skipped", error=write_error.get("errmsg"),
+                                     record=docs[write_error["index"]])
+                        continue
+                    logfire.error("Error inserting record", error=write_error.get("errmsg"),
+                                  code=write_error.get("code"), record=docs[write_error["index"]])
+                for concern_error in e.details.get("writeConcernErrors", []):
+                    # The documents were written but not acknowledged by enough nodes; they are still counted
+                    logfire.warning("Write concern not satisfied", collection=collection.name,
+                                    error=concern_error.get("errmsg"), code=concern_error.get("code"))
+                inserted = e.details.get("nInserted", 0)
+                span.set_attribute("inserted", inserted)
+                span.set_attribute("errors", len(write_errors))
+                return inserted, len(write_errors)
+            except Exception as e:
+                logfire.error("Error inserting batch", collection=collection.name, error=str(e), size=len(docs))
+                return 0, len(docs)
+
+            span.set_attribute("inserted", result.inserted_count)
+            return result.inserted_count, 0
+        finally:
+            # InsertOne fills in any missing _id before sending, so the ids are known even if the write failed
+            span.set_attribute("first_id", str(docs[0].get("_id")))
+            span.set_attribute("last_id", str(docs[-1].get("_id")))
+
+
+def submit_insert(executor, futures, collection, docs, max_in_flight=MAX_IN_FLIGHT):
+    """
+    Submits bulk_insert(collection, docs) to executor and appends its future to futures.
+    If more than max_in_flight batches are then pending, waits for the oldest of them, so a reader that is
+    faster than the server cannot queue the whole input file in memory.
+    """
+    futures.append(executor.submit(bulk_insert, collection, docs))
+    if len(futures) > max_in_flight:
+        # Executors run tasks in submission order: once this one is done, at most max_in_flight remain
+        futures[-max_in_flight - 1].result()
+
+
+def wait_inserts(futures):
+    """
+    Waits for bulk_insert calls submitted to an executor.
+    Returns:
+        tuple: (inserted, failed) document counts summed over all futures.
+    """
+    success, errors = 0, 0
+    for future in as_completed(futures):
+        inserted, failed = future.result()
+        success += inserted
+        errors += failed
+    return success, errors
@@ -1,3 +1,47 @@
+from functools import lru_cache
+
+_LEVEL_MAP = {
+    "camera": "Rooms",
+    "camere": "Rooms",
+    "room": "Rooms",
+    "rooms": "Rooms",
+    "studio room": "Rooms",
+    "junior suite": "Junior Suite",
+    "suite": "Suite",
+    "appartamento": "Apartment",
+    "appartamenti": "Apartment",
+    "apartment": "Apartment",
+    "apartments": "Apartment",
+    "villa": "Villa",
+    "ville": "Villa",
+    "villetta": "Villa",
+    "castello": "Villa",
+    "castelli": "Villa",
+    "castelletto": "Villa",
+    "chalet": "Villa",
+    "depandance": "Dependence",
+    "studio": "Studio",
+    "bungalow": "Bungalow",
+    "dormitory": "Dormitory"
+}
+
+# Entries of _LEVEL_MAP spanning more than one word, matched against the leading words only
+_MULTIWORD = {key for key in _LEVEL_MAP if " " in key}
+
+# Only a handful of distinct accommodation types recur across a whole import.
+# The cache sits on this str-only helper, so unhashable inputs never reach it.
+@lru_cache(maxsize=4096)
+def _level_for(accommodation_type: str) -> str:
+    words = accommodation_type.lower().split()
+    # The only multi-word keys are two words long, so one prefix check covers them
+    head = " ".join(words[:2])
+    if head in _MULTIWORD:
+        return _LEVEL_MAP[head]
+    for word in words:
+        level = _LEVEL_MAP.get(word)
+        if level:
+            return level
+    return "Other"
 
 def extract_accommodation_level(accommodation_type: str) -> str:
     """
@@ -8,37 +52,4 @@ def extract_accommodation_level(accommodation_type: str) -> str:
     if not accommodation_type or not isinstance(accommodation_type, str):
         return "Other"
 
-    level_map = {
-        "camera": "Rooms",
-        "camere": "Rooms",
-        "room": "Rooms",
-        "rooms": "Rooms",
-        "studio room": "Rooms",
-        "junior suite": "Junior Suite",
-        "suite": "Suite",
-        "appartamento": "Apartment",
-        "appartamenti": "Apartment",
-        "apartment": "Apartment",
-        "apartments": "Apartment",
-        "villa": "Villa",
-        "ville": "Villa",
-        "villetta": "Villa",
-        "castello": "Villa",
-        "castelli": "Villa",
-        "castelletto": "Villa",
-        "chalet": "Villa",
-        "depandance": "Dependence",
-        "studio": "Studio",
-        "bungalow": "Bungalow",
-        "dormitory": "Dormitory"
-    }
-
-    words = accommodation_type.lower().split()
-    for n in range(len(words), 0, -1):
-        phrase = " ".join(words[:n])
-        if phrase in level_map:
-            return level_map[phrase]
-    for word in words:
-        if word in level_map:
-            return level_map[word]
-    return "Other"
\ No newline at end of file
+    return _level_for(accommodation_type)
\ No newline at end of file
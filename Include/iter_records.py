@@ -0,0 +1,84 @@
+"""
+iter_records.py
+
+Streams the records of a JSON export one at a time with ijson, so large files are never fully
+materialized in memory and inserts can start while the rest of the file is still being parsed.
+Smaller exports that are read whole go through orjson when it is installed, falling back to the stdlib json module.
+JSON Lines shards written by split_json.py are read back one line at a time.
+"""
+
+import mmap
+import os
+import ijson
+import logfire
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib parser gives the same results, only slower
+    import json
+    orjson = None
+
+# Above this size load_records streams the file instead of parsing it in one go
+STREAM_THRESHOLD = 500_000_000
+
+
+def iter_records(file_path):
+    """
+    Yields each element of the top-level JSON array stored in file_path.
+    Numbers are returned as int/float rather than Decimal so the documents stay BSON-encodable.
+    """
+    if ijson.backend == "python":
+        # ijson picks its compiled yajl2_c backend when the wheel ships it; the pure-Python fallback is many times slower
+        logfire.warning("ijson is using its pure-Python backend", backend=ijson.backend, file=file_path)
+    with open(file_path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
+
+
+def iter_jsonl(file_path):
+    """
+    Yields the record on each line of a JSON Lines file, such as the shards written by split_json.py.
+    Blank lines are skipped.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(file_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def load_records(file_path):
+    """
+    Returns the records of the JSON array stored in file_path.
+    Files up to STREAM_THRESHOLD bytes are parsed in one go; orjson reads them straight from a memory map,
+    so the raw bytes are never copied into a Python object next to the parsed list.
+    Larger files are streamed with iter_records instead, so callers should only iterate over the result.
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= STREAM_THRESHOLD:
+            if orjson is None:
+                return json.loads(f.read())
+            if size == 0:
+                return orjson.loads(b"")  # mmap cannot map an empty file; raises the usual JSONDecodeError
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    return iter_records(file_path)
+
+
+def dump_record(record) -> bytes:
+    """
+    Serializes record as one UTF-8 JSON line, e.g. for appending to a skipped-records file opened in binary mode.
+    """
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def dump_id(value) -> bytes:
+    """
+    Formats an id exactly as it appears in the export as one line, for a skipped-ids file opened in binary mode.
+    Integer ids, the usual case, are formatted without going through a text encoder.
+    """
+    if isinstance(value, int):
+        return b"%d\n" % value
+    return f"{value}\n".encode("utf-8")
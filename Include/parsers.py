@@ -1,51 +1,103 @@
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
 
+# Italian month names, so 'gennaio 2025' can be parsed without switching the process-wide locale
+_IT_MONTHS = {
+    "gennaio": 1,
+    "febbraio": 2,
+    "marzo": 3,
+    "aprile": 4,
+    "maggio": 5,
+    "giugno": 6,
+    "luglio": 7,
+    "agosto": 8,
+    "settembre": 9,
+    "ottobre": 10,
+    "novembre": 11,
+    "dicembre": 12,
+}
 
-def parse_int(val):
+# The same strings (stars, occupancy, search dates...) repeat across thousands of records,
+# so the string parsers are memoized; only str inputs reach them, which are always hashable.
+@lru_cache(maxsize=8192)
+def _parse_int_str(val: str) -> Optional[int]:
+    try:
+        return int(val)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=8192)
+def _parse_float_str(val: str) -> Optional[float]:
+    val = val.replace('Punteggio di ', '').strip()  # Remove specific prefixes
+    val = val.replace(',', '.')  # Replace ',' with '.' for decimal points
+    try:
+        return float(val)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=8192)
+def _parse_date_str(date_input: str) -> Optional[datetime]:
+    try:
+        # Fast path for 'YYYY-MM-DD'. date (not datetime) rejects times and UTC offsets, which stay unparsed
+        day = date.fromisoformat(date_input)
+        return datetime(day.year, day.month, day.day)
+    except ValueError:
+        pass
+    try:
+        # Same format without zero padding, e.g. '2025-3-5'
+        return datetime.strptime(date_input, "%Y-%m-%d")
+    except ValueError:
+        pass
+    # Handle month names like 'gennaio 2025'
+    parts = date_input.lower().split()
+    if len(parts) == 2 and parts[0] in _IT_MONTHS:
+        try:
+            return datetime(int(parts[1]), _IT_MONTHS[parts[0]], 1)
+        except ValueError:
+            return None
+    return None
+
+def parse_int(val) -> Optional[int]:
     """
     Safely parse an int from val. Returns None if val is empty or invalid.
     """
+    if isinstance(val, int):
+        return int(val)  # Already numeric; int() also turns bools into 0/1
+    if val is None or val == '':
+        return None
+    if isinstance(val, str):
+        return _parse_int_str(val)
     try:
-        if val == '' or val is None:
-            return None
         return int(val)
     except (ValueError, TypeError):
         return None
-    
-def parse_float(val):
+
+def parse_float(val) -> Optional[float]:
     """
     Safely parse a float from val. Handles ',' as a decimal separator and strings like 'Punteggio di 8,0'.
     Returns None if val is empty or invalid.
     """
+    if isinstance(val, float):
+        return val
+    if val is None or val == '':
+        return None
+    if isinstance(val, str):
+        return _parse_float_str(val)
     try:
-        if val == '' or val is None:
-            return None
-        if isinstance(val, str):
-            val = val.replace('Punteggio di ', '').strip()  # Remove specific prefixes
-            val = val.replace(',', '.')  # Replace ',' with '.' for decimal points
         return float(val)
     except (ValueError, TypeError):
         return None
-    
+
 def parse_date(date_input) -> Optional[datetime]:
     """
     Parse a date string in 'YYYY-MM-DD' format, month names like 'gennaio 2025',
     or a date object to a datetime object. Returns None if the input is None or invalid.
     """
-    from datetime import datetime, date
-    import locale
-
-    try:
-        if isinstance(date_input, str):
-            try:
-                # Attempt to parse 'YYYY-MM-DD' format
-                return datetime.strptime(date_input, "%Y-%m-%d")
-            except ValueError:
-                # Handle month names like 'gennaio 2025'
-                locale.setlocale(locale.LC_TIME, 'it_IT.UTF-8')  # Set locale to Italian
-                return datetime.strptime(date_input, "%B %Y")
-        elif isinstance(date_input, date) and not isinstance(date_input, datetime):
-            return datetime.combine(date_input, datetime.min.time())
-    except (ValueError, TypeError):
-        return None
+    if date_input is None or isinstance(date_input, datetime):
+        return date_input
+    if isinstance(date_input, str):
+        return _parse_date_str(date_input)
+    if isinstance(date_input, date):
+        return datetime(date_input.year, date_input.month, date_input.day)  # Midnight of that day
+    return None
@@ -0,0 +1,53 @@
+"""
+split_json.py
+
+Script to split a large JSON export into JSON Lines shards of about SHARD_BYTES each.
+The source array is streamed once with ijson, and every record is written as one line, so the shards can be
+imported by parallel processes (see SEED_SHARDS in seed_reviews.py) without any of them parsing the whole file.
+"""
+
+import os
+import logfire
+from iter_records import iter_records, dump_record
+
+# Start logfire session
+logfire.configure()
+
+# A shard is closed once it holds at least this many bytes
+SHARD_BYTES = 128 * 1024 * 1024
+
+
+def split_json(file_path, out_dir, shard_bytes=SHARD_BYTES):
+    """
+    Writes the records of the JSON array in file_path to out_dir/shard_000.jsonl, shard_001.jsonl, ...
+    Records are never split across shards, so a shard can end slightly above shard_bytes.
+    Returns:
+        list: Paths of the written shards, in order.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    shard_paths = []
+    shard, written = None, 0
+
+    try:
+        for record in iter_records(file_path):
+            if shard is None:
+                shard_path = os.path.join(out_dir, f"shard_{len(shard_paths):03d}.jsonl")
+                shard_paths.append(shard_path)
+                shard, written = open(shard_path, "wb"), 0
+            written += shard.write(dump_record(record))
+            if written >= shard_bytes:
+                shard.close()
+                shard = None
+    finally:
+        # Also flushes and closes the current shard when the export fails to parse part-way
+        if shard is not None:
+            shard.close()
+
+    logfire.info("Split JSON export", file=file_path, shards=len(shard_paths))
+    return shard_paths
+
+
+if __name__ == "__main__":
+    file_path = r"C:\Users\Eiji\Desktop\LdC_HTL_Reviews_20250201.json"  # Adjust path as needed
+    shard_paths = split_json(file_path, "shards")
+    print(f"Wrote {len(shard_paths)} shards to shards/")
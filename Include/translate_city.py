@@ -6,15 +6,18 @@ CITY_TRANSLATION = {
     "Naples": "Napoli",
     "Turin": "Torino",
     "Genoa": "Genova",
-    "Bologna": "Bologna",
-    "Palermo": "Palermo",
-    "Bari": "Bari",
     # Add more as needed
 }
 
+# Case-insensitive view of the table, so "MILAN" and "milan" translate like "Milan".
+# Names that are the same in both languages (Bologna, Palermo, Bari...) need no entry: they fall through unchanged.
+_CITY_CI = {name.casefold(): translation for name, translation in CITY_TRANSLATION.items()}
+
 def translate_city(city_name: str) -> str:
     """
-    Translate city names from English (or other languages) to Italian using a dictionary.
-    If not found, returns the original name.
+    Translate city names from English (or other languages) to Italian using a dictionary, ignoring case.
+    If not found, or if city_name is not a string, returns the original value.
     """
-    return CITY_TRANSLATION.get(city_name, city_name)
\ No newline at end of file
+    if not isinstance(city_name, str):
+        return city_name
+    return _CITY_CI.get(city_name.casefold(), city_name)
\ No newline at end of file